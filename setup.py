@@ -23,7 +23,8 @@ setup(
     ],
     description='Bindings for the ShipStation API in Python',
     include_package_data=True,
-    install_requires=['requests>=2.6.0'],
+    install_requires=['requests>=2.10.0'],
+    extras_require={'speedups': ['orjson']},
     license='MIT',
     packages=['shipstation'],
     url='https://github.com/natecox/pyshipstation'
@@ -1,31 +1,185 @@
+import base64
 import datetime
 from decimal import Decimal
 import json
+import logging
+import operator
+from multiprocessing.pool import ThreadPool
 import pprint
 import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+API_URL = "https://ssapi.shipstation.com"
+CREATE_ORDER_ENDPOINT = "/orders/createorder"
+LIST_ORDERS_ENDPOINT = "/orders/list"
+
+
+def _json_dumps(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _response_json(r):
+    if orjson is not None:
+        return orjson.loads(r.content)
+    return r.json()
+
+
+class _BasicAuthHeader(requests.auth.AuthBase):
+    """
+    HTTP Basic auth with the header encoded once up front, instead of on
+    every request as requests.auth.HTTPBasicAuth does. Being a session
+    auth, it also keeps requests from consulting ~/.netrc per request.
+    """
+
+    def __init__(self, key, secret):
+        token = base64.b64encode(
+            "{}:{}".format(key, secret).encode("latin1")).decode("ascii")
+        self.header = "Basic " + token
+
+    def __call__(self, r):
+        r.headers["Authorization"] = self.header
+        return r
+
+
+_camel_case_cache = {}
+
+
+def _to_camel_case(name):
+    # Names come from a small fixed set of attributes and parameters, so
+    # the cache stays bounded without needing eviction.
+    try:
+        return _camel_case_cache[name]
+    except KeyError:
+        if "_" not in name:
+            camel = name.lower()
+        else:
+            tokens = name.lower().split("_")
+            camel = tokens[0] + "".join(x[:1].upper() + x[1:]
+                                        for x in tokens[1:])
+        _camel_case_cache[name] = camel
+        return camel
+
+
+_slot_layout_cache = {}
+
+
+def _slot_layout(cls):
+    # The camelCase keys and a single attrgetter for every __slots__ entry
+    # declared on cls and its bases, so as_dict can fetch all values in one
+    # call instead of looping over getattr.
+    try:
+        return _slot_layout_cache[cls]
+    except KeyError:
+        names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in klass.__dict__.get("__slots__", ())
+            if name not in ("__dict__", "__weakref__")
+        )
+        if len(names) > 1:
+            get_values = operator.attrgetter(*names)
+        elif names:
+            get_value = operator.attrgetter(names[0])
+
+            def get_values(obj):
+                return (get_value(obj),)
+        else:
+            def get_values(obj):
+                return ()
+
+        layout = (tuple(_to_camel_case(name) for name in names), get_values)
+        _slot_layout_cache[cls] = layout
+        return layout
 
 
 class ShipStationBase(object):
+    # Known fields live in each model's __slots__. The __dict__ slot keeps
+    # any other ShipStation field (tag_ids, customer_id, ...) settable as
+    # a plain attribute, and as_dict serializes those too.
+    __slots__ = ("__dict__",)
+
     @classmethod
     def to_camel_case(cls, name):
-        tokens = name.lower().split("_")
-        first_word = tokens.pop(0)
-        return first_word + "".join(x.title() for x in tokens)
+        return _to_camel_case(name)
+
+    @classmethod
+    def _validate_enum(cls, value, allowed, name):
+        """
+        Returns `value` if it is one of `allowed`, or None if it is empty.
+        Raises AttributeError for any other value.
+        """
+        if not value:
+            return None
+        if value not in allowed:
+            raise AttributeError(
+                "{} value {!r} is not valid".format(name, value))
+        return value
 
     def as_dict(self):
-        d = dict()
+        keys, get_values = _slot_layout(type(self))
+        items = list(zip(keys, get_values(self)))
+        # Reading __dict__ materializes an empty dict on instances without
+        # extra fields. CPython offers no cheaper way to check for them.
+        items.extend(
+            (_to_camel_case(key), value)
+            for key, value in getattr(self, "__dict__", {}).items()
+        )
+
+        return {
+            key: None if value is None else str(value) for key, value in items
+        }
 
-        for key, value in self.__dict__.items():
-            key = self.to_camel_case(key)
-            if value is None:
-                d[key] = None
-            else:
-                d[key] = str(value)
 
-        return d
+def _make_parameter_validator(camel_names, description):
+    """
+    Builds a validator for one endpoint's query parameters.
+
+    `camel_names` maps each allowed snake_case parameter to its camelCase
+    form. The returned function rejects unknown keys and returns the
+    parameters renamed for the ShipStation API.
+    """
+
+    def validate(parameters):
+        if not isinstance(parameters, dict):
+            raise AttributeError("`parameters` must be of type dict")
+
+        invalid_keys = [key for key in parameters if key not in camel_names]
+        if invalid_keys:
+            raise AttributeError(
+                "Invalid {} parameters: {}".format(
+                    description, ", ".join(invalid_keys))
+            )
+
+        return {camel_names[key]: value for key, value in parameters.items()}
+
+    return validate
 
 
 class ShipStationCustomsItem(ShipStationBase):
+    __slots__ = (
+        "description",
+        "quantity",
+        "value",
+        "harmonized_tariff_code",
+        "country_of_origin",
+    )
+
+    REQUIRED_ATTRIBUTES = (
+        "description",
+        "harmonized_tariff_code",
+        "country_of_origin",
+    )
+
     def __init__(
         self,
         description=None,
@@ -40,23 +194,23 @@ class ShipStationCustomsItem(ShipStationBase):
         self.harmonized_tariff_code = harmonized_tariff_code
         self.country_of_origin = country_of_origin
 
-        if not self.description:
-            raise AttributeError("description may not be empty")
-        if not self.harmonized_tariff_code:
-            raise AttributeError("harmonized_tariff_code may not be empty")
-        if not self.country_of_origin:
-            raise AttributeError("country_of_origin may not be empty")
-        if len(self.country_of_origin) is not 2:
+        for name in self.REQUIRED_ATTRIBUTES:
+            if not getattr(self, name):
+                raise AttributeError("{} may not be empty".format(name))
+        if len(self.country_of_origin) != 2:
             raise AttributeError("country_of_origin must be two characters")
         if not isinstance(value, Decimal):
             raise AttributeError("value must be decimal")
 
 
 class ShipStationInternationalOptions(ShipStationBase):
-    CONTENTS_VALUES = ("merchandise", "documents",
-                       "gift", "returned_goods", "sample")
+    __slots__ = ("customs_items", "contents", "non_delivery")
+
+    CONTENTS_VALUES = frozenset(("merchandise", "documents",
+                                 "gift", "returned_goods", "sample"))
 
-    NON_DELIVERY_OPTIONS = ("return_to_sender", "treat_as_abandoned")
+    NON_DELIVERY_OPTIONS = frozenset(
+        ("return_to_sender", "treat_as_abandoned"))
 
     def __init__(self, contents=None, non_delivery=None):
         self.customs_items = []
@@ -64,12 +218,8 @@ class ShipStationInternationalOptions(ShipStationBase):
         self.set_non_delivery(non_delivery)
 
     def set_contents(self, contents):
-        if contents:
-            if contents not in self.CONTENTS_VALUES:
-                raise AttributeError("contents value not valid")
-            self.contents = contents
-        else:
-            self.contents = None
+        self.contents = self._validate_enum(
+            contents, self.CONTENTS_VALUES, "contents")
 
     def add_customs_item(self, customs_item):
         if customs_item:
@@ -84,12 +234,8 @@ class ShipStationInternationalOptions(ShipStationBase):
         return [x.as_dict() for x in self.customs_items]
 
     def set_non_delivery(self, non_delivery):
-        if non_delivery:
-            if non_delivery not in self.NON_DELIVERY_OPTIONS:
-                raise AttributeError("non_delivery value is not valid")
-            self.non_delivery = non_delivery
-        else:
-            self.non_delivery = None
+        self.non_delivery = self._validate_enum(
+            non_delivery, self.NON_DELIVERY_OPTIONS, "non_delivery")
 
     def as_dict(self):
         d = super(ShipStationInternationalOptions, self).as_dict()
@@ -100,12 +246,16 @@ class ShipStationInternationalOptions(ShipStationBase):
 
 
 class ShipStationWeight(ShipStationBase):
+    __slots__ = ("units", "value")
+
     def __init__(self, units=None, value=None):
         self.units = units
         self.value = value
 
 
 class ShipStationContainer(ShipStationBase):
+    __slots__ = ("units", "length", "width", "height", "weight")
+
     def __init__(self, units=None, length=None, width=None, height=None):
         self.units = units
         self.length = length
@@ -129,6 +279,18 @@ class ShipStationContainer(ShipStationBase):
 
 
 class ShipStationItem(ShipStationBase):
+    __slots__ = (
+        "key",
+        "sku",
+        "name",
+        "image_url",
+        "weight",
+        "quantity",
+        "unit_price",
+        "warehouse_location",
+        "options",
+    )
+
     def __init__(
         self,
         key=None,
@@ -166,6 +328,20 @@ class ShipStationItem(ShipStationBase):
 
 
 class ShipStationAddress(ShipStationBase):
+    __slots__ = (
+        "name",
+        "company",
+        "street1",
+        "street2",
+        "street3",
+        "city",
+        "state",
+        "postal_code",
+        "country",
+        "phone",
+        "residential",
+    )
+
     def __init__(
         self,
         name=None,
@@ -188,6 +364,7 @@ class ShipStationAddress(ShipStationBase):
         self.city = city
         self.state = state
         self.postal_code = postal_code
+        self.country = country
         self.phone = phone
         self.residential = residential
 
@@ -198,22 +375,54 @@ class ShipStationOrder(ShipStationBase):
     contains the tools for submitting the order to ShipStation.
     """
 
-    ORDER_STATUS_VALUES = (
+    __slots__ = (
+        "order_number",
+        "order_date",
+        "order_status",
+        "bill_to",
+        "ship_to",
+        "order_key",
+        "payment_date",
+        "customer_username",
+        "customer_email",
+        "items",
+        "amount_paid",
+        "tax_amount",
+        "shipping_amount",
+        "customer_notes",
+        "internal_notes",
+        "gift",
+        "payment_method",
+        "carrier_code",
+        "service_code",
+        "package_code",
+        "confirmation",
+        "ship_date",
+        "dimensions",
+        "insurance_options",
+        "international_options",
+        "advanced_options",
+    )
+
+    ORDER_STATUS_VALUES = frozenset((
         "awaiting_payment",
         "awaiting_shipment",
         "shipped",
         "on_hold",
         "cancelled",
-    )
+    ))
+
+    # Decimals are immutable, so every order can share one zero amount.
+    ZERO_AMOUNT = Decimal("0")
 
     # TODO: add method for adding confirmation which respects these values.
-    CONFIRMATION_VALUES = (
+    CONFIRMATION_VALUES = frozenset((
         "none",
         "delivery",
         "signature",
         "adult_signature",
         "direct_signature",
-    )
+    ))
 
     def __init__(self, order_key=None, order_number=None):
 
@@ -230,9 +439,9 @@ class ShipStationOrder(ShipStationBase):
         self.customer_username = None
         self.customer_email = None
         self.items = []
-        self.amount_paid = Decimal("0")
-        self.tax_amount = Decimal("0")
-        self.shipping_amount = Decimal("0")
+        self.amount_paid = self.ZERO_AMOUNT
+        self.tax_amount = self.ZERO_AMOUNT
+        self.shipping_amount = self.ZERO_AMOUNT
         self.customer_notes = None
         self.internal_notes = None
         self.gift = None
@@ -248,12 +457,8 @@ class ShipStationOrder(ShipStationBase):
         self.advanced_options = None
 
     def set_status(self, status=None):
-        if not status:
-            self.order_status = None
-        elif status not in self.ORDER_STATUS_VALUES:
-            raise AttributeError("Invalid status value")
-        else:
-            self.order_status = status
+        self.order_status = self._validate_enum(
+            status, self.ORDER_STATUS_VALUES, "status")
 
     def set_customer_details(self, username=None, email=None):
         self.customer_username = username
@@ -302,9 +507,10 @@ class ShipStationOrder(ShipStationBase):
         return self.order_date
 
     def get_weight(self):
+        # Seed with an int so both Decimal and float weights accumulate
+        # without mixed-type errors.
         weight = 0
-        items = self.get_items()
-        for item in items:
+        for item in self.items:
             weight += item.weight.value * item.quantity
 
         if self.dimensions and self.dimensions.weight:
@@ -355,7 +561,7 @@ class ShipStation(ShipStationBase):
     Handles the details of connecting to and querying a ShipStation account.
     """
 
-    ORDER_LIST_PARAMETERS = (
+    ORDER_LIST_PARAMETERS = frozenset((
         "customer_name",
         "item_keyword",
         "create_date_start",
@@ -373,9 +579,20 @@ class ShipStation(ShipStationBase):
         "sort_dir",
         "page",
         "page_size",
+    ))
+
+    _JSON_HEADERS = {"content-type": "application/json"}
+
+    ORDER_LIST_PARAMETERS_CAMEL = dict(
+        zip(ORDER_LIST_PARAMETERS,
+            map(ShipStationBase.to_camel_case, ORDER_LIST_PARAMETERS))
+    )
+
+    validate_order_list_parameters = staticmethod(
+        _make_parameter_validator(ORDER_LIST_PARAMETERS_CAMEL, "order list")
     )
 
-    def __init__(self, key=None, secret=None, debug=False):
+    def __init__(self, key=None, secret=None, debug=False, timeout=None):
         """
         Connecting to ShipStation required an account and a
         :return:
@@ -386,13 +603,40 @@ class ShipStation(ShipStationBase):
         if secret is None:
             raise AttributeError("Secret must be supplied.")
 
-        self.url = "https://ssapi.shipstation.com"
+        self.url = API_URL
 
         self.key = key
         self.secret = secret
         self.orders = []
 
         self.debug = debug
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.auth = _BasicAuthHeader(key, secret)
+        self.session.headers.update(self._JSON_HEADERS)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 502, 503, 504),
+                raise_on_status=False,
+            ),
+        ))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying HTTP session and its pooled connections.
+        """
+        self.session.close()
 
     def add_order(self, order):
         if type(order) is not ShipStationOrder:
@@ -402,26 +646,68 @@ class ShipStation(ShipStationBase):
     def get_orders(self):
         return self.orders
 
+    def submit_order(self, order):
+        return self.post(endpoint=CREATE_ORDER_ENDPOINT,
+                         data=_json_dumps(order.as_dict()))
+
     def submit_orders(self):
-        for order in self.orders:
-            self.post(endpoint="/orders/createorder",
-                      data=json.dumps(order.as_dict()))
+        return [self.submit_order(order) for order in self.orders]
 
-    def get(self, endpoint="", payload=None):
-        url = "{}{}".format(self.url, endpoint)
-        r = requests.get(url, auth=(self.key, self.secret), params=payload)
-        if self.debug:
-            pprint.PrettyPrinter(indent=4).pprint(r.json())
+    def submit_orders_threaded(self, max_workers=8):
+        """
+            Submit all queued orders concurrently over the shared session.
 
-        return r
+            Args:
+                max_workers (int): Number of orders in flight at once.
+
+            Returns:
+                A list with one entry per queued order, in order. Each entry
+                is the order's <Response [code]>, or the
+                requests.RequestException (e.g. a Timeout) raised while
+                sending it, so one failure does not hide the other results.
+        """
+
+        return self._map_threaded(self.submit_order, self.orders, max_workers)
+
+    def _map_threaded(self, func, items, max_workers):
+        if not items:
+            return []
+
+        def call(item):
+            try:
+                return func(item)
+            except requests.RequestException as e:
+                return e
+
+        pool = ThreadPool(min(max_workers, len(items)))
+        try:
+            return pool.map(call, items)
+        finally:
+            pool.close()
+            pool.join()
+
+    def get(self, endpoint="", payload=None):
+        return self._request("GET", endpoint, params=payload)
 
     def post(self, endpoint="", data=None):
-        url = "{}{}".format(self.url, endpoint)
-        headers = {"content-type": "application/json"}
-        r = requests.post(url, auth=(self.key, self.secret),
-                          data=data, headers=headers)
+        return self._request("POST", endpoint, data=data)
+
+    def _request(self, method, endpoint, params=None, data=None):
+        url = self.url + endpoint
+        r = self.session.request(method, url, params=params, data=data,
+                                 timeout=self.timeout)
         if self.debug:
-            pprint.PrettyPrinter(indent=4).pprint(r.json())
+            logger.debug("%s %s", method, url)
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    body = pprint.pformat(_response_json(r), indent=4)
+                except ValueError:
+                    # Empty, HTML or other non-JSON bodies, e.g. a 401 page
+                    # or a 5xx returned after retries are exhausted.
+                    body = r.text
+                logger.debug("%s", body)
+
+        return r
 
     def fetch_orders(self, parameters={}):
         """
@@ -441,23 +727,57 @@ class ShipStation(ShipStationBase):
                 >>> ss.fetch_orders(parameters={'order_status': 'shipped', 'page': '2'})
         """
 
-        if not isinstance(parameters, dict):
-            raise AttributeError("`parameters` must be of type dict")
+        valid_parameters = self.validate_order_list_parameters(parameters)
 
-        invalid_keys = set(parameters.keys()).difference(
-            self.ORDER_LIST_PARAMETERS)
+        return self.get(
+            endpoint=LIST_ORDERS_ENDPOINT,
+            payload=valid_parameters
+        )
 
-        if invalid_keys:
-            raise AttributeError(
-                "Invalid order list parameters: {}".format(
-                    ", ".join(invalid_keys))
-            )
+    def fetch_all_orders(self, parameters={}, max_workers=8):
+        """
+            Fetch every page of existing orders matching the filters.
 
-        valid_parameters = {
-            self.to_camel_case(key): value for key, value in parameters.items()
-        }
+            The first page is fetched to learn the page count, then the
+            remaining pages are fetched concurrently over the shared session.
 
-        return self.get(
-            endpoint='/orders/list',
-            payload=valid_parameters
+            Args:
+                parameters (dict): Dict of filters to filter by. Any `page`
+                    filter is ignored.
+                max_workers (int): Number of pages in flight at once.
+
+            Raises:
+                AttributeError: parameters not of type dict
+                AttributeError: invalid key in parameters dict.
+                requests.RequestException: the first page could not be
+                    fetched.
+
+            Returns:
+                A list of <Response [code]> objects, one per page, in order.
+                If the first page fails, only that response is returned.
+                A later page that raises requests.RequestException has the
+                exception in its place instead of a response.
+
+            Examples:
+                >>> ss.fetch_all_orders(parameters={'order_status': 'shipped'})
+        """
+
+        self.validate_order_list_parameters(parameters)
+
+        first = self.fetch_orders(parameters=dict(parameters, page=1))
+        if not first.ok:
+            return [first]
+
+        pages = int(_response_json(first).get("pages") or 1)
+        if pages <= 1:
+            return [first]
+
+        page_parameters = [
+            dict(parameters, page=page) for page in range(2, pages + 1)
+        ]
+
+        return [first] + self._map_threaded(
+            lambda p: self.fetch_orders(parameters=p),
+            page_parameters,
+            max_workers,
         )
@@ -0,0 +1,25 @@
+import unittest
+from shipstation.api import *
+
+
+class ShipStationCamelCaseTests(unittest.TestCase):
+    def test_single_word_is_lowercased(self):
+        self.assertEqual(ShipStationBase.to_camel_case("Sku"), "sku")
+
+    def test_words_are_joined(self):
+        self.assertEqual(
+            ShipStationBase.to_camel_case("harmonized_tariff_code"),
+            "harmonizedTariffCode",
+        )
+
+    def test_repeated_calls_agree(self):
+        first = ShipStationBase.to_camel_case("order_number")
+        second = ShipStationBase.to_camel_case("order_number")
+
+        self.assertEqual(first, "orderNumber")
+        self.assertEqual(first, second)
+
+    def test_digits_do_not_start_a_new_word(self):
+        self.assertEqual(
+            ShipStationBase.to_camel_case("address_line2b"), "addressLine2b"
+        )
@@ -19,6 +19,7 @@ class ShipStationTests(unittest.TestCase):
         )
 
     def tearDown(self):
+        self.ss.close()
         self.ss = None
         self.ss_order = None
         self.ss_intl = None
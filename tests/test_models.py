@@ -0,0 +1,55 @@
+import unittest
+from nose.tools import raises
+from shipstation.api import *
+
+
+class ShipStationModelTests(unittest.TestCase):
+    def setUp(self):
+        self.ss_order = ShipStationOrder(order_number="1")
+        self.ss_weight = ShipStationWeight(units="ounces", value=3)
+        self.ss_item = ShipStationItem(sku="sku", quantity=2, unit_price=1)
+        self.ss_item.set_weight(self.ss_weight)
+
+    def tearDown(self):
+        self.ss_order = None
+        self.ss_weight = None
+        self.ss_item = None
+
+    def test_address_serializes_country(self):
+        address = ShipStationAddress(name="name", country="US")
+
+        self.assertEqual(address.as_dict()["country"], "US")
+
+    def test_models_serialize_extra_fields(self):
+        self.ss_order.customer_id = 42
+        self.ss_order.requested_shipping_service = "ground"
+        d = self.ss_order.as_dict()
+
+        self.assertEqual(d["customerId"], "42")
+        self.assertEqual(d["requestedShippingService"], "ground")
+
+    def test_item_as_dict_includes_weight(self):
+        expected = {"units": "ounces", "value": "3"}
+        actual = self.ss_item.as_dict()["weight"]
+
+        self.assertDictEqual(expected, actual)
+
+    def test_order_as_dict_uses_camel_case_keys(self):
+        self.ss_order.add_item(self.ss_item)
+        d = self.ss_order.as_dict()
+
+        self.assertEqual(d["orderNumber"], "1")
+        self.assertEqual(d["amountPaid"], "0")
+        self.assertIsNone(d["shipTo"])
+        self.assertEqual(d["weight"], {"units": "ounces", "value": 6})
+        self.assertEqual(d["items"][0]["unitPrice"], "1")
+
+    def test_empty_status_clears_order_status(self):
+        self.ss_order.set_status("shipped")
+        self.ss_order.set_status("")
+
+        self.assertIsNone(self.ss_order.order_status)
+
+    @raises(AttributeError)
+    def test_order_status_must_be_valid(self):
+        self.ss_order.set_status("something_else")
@@ -1,4 +1,6 @@
+import json
 import unittest
+import requests
 from nose.tools import raises
 from shipstation.api import *
 
@@ -8,6 +10,7 @@ class ShipStationApiTests(unittest.TestCase):
         self.ss = ShipStation("123", "456")
 
     def tearDown(self):
+        self.ss.close()
         self.ss = None
 
     @raises(AttributeError)
@@ -17,3 +20,89 @@ class ShipStationApiTests(unittest.TestCase):
     @raises(AttributeError)
     def test_fetch_orders_must_use_correct_parameter(self):
         self.ss.fetch_orders(parameters={"bad": "not good"})
+
+    def test_order_list_parameters_are_precomputed_in_camel_case(self):
+        self.assertEqual(
+            self.ss.ORDER_LIST_PARAMETERS_CAMEL["create_date_start"],
+            "createDateStart",
+        )
+        self.assertEqual(
+            set(self.ss.ORDER_LIST_PARAMETERS_CAMEL),
+            set(self.ss.ORDER_LIST_PARAMETERS),
+        )
+
+    def test_validate_order_list_parameters_renames_keys(self):
+        expected = {"orderStatus": "shipped", "page": "2"}
+        actual = self.ss.validate_order_list_parameters(
+            {"order_status": "shipped", "page": "2"}
+        )
+
+        self.assertDictEqual(expected, actual)
+
+    def test_fetch_all_orders_fetches_every_page(self):
+        class FakeResponse(object):
+            ok = True
+
+            def __init__(self, page):
+                self.page = page
+                self.content = json.dumps({"page": page, "pages": 3}).encode()
+
+            def json(self):
+                return json.loads(self.content.decode())
+
+        def fake_get(endpoint="", payload=None):
+            return FakeResponse(payload["page"])
+
+        self.ss.get = fake_get
+
+        responses = self.ss.fetch_all_orders(
+            parameters={"order_status": "shipped", "page": 5}
+        )
+
+        self.assertEqual([r.page for r in responses], [1, 2, 3])
+
+    def test_fetch_all_orders_single_page_skips_thread_pool(self):
+        class FakeResponse(object):
+            ok = True
+            content = json.dumps({"page": 1, "pages": 1}).encode()
+
+            def json(self):
+                return {"page": 1, "pages": 1}
+
+        def fail_map_threaded(func, items, max_workers):
+            raise AssertionError("no pages left to fetch")
+
+        self.ss.get = lambda endpoint="", payload=None: FakeResponse()
+        self.ss._map_threaded = fail_map_threaded
+
+        self.assertEqual(len(self.ss.fetch_all_orders()), 1)
+
+    def test_fetch_all_orders_returns_failed_pages_in_place(self):
+        error = requests.ConnectionError("connection reset")
+
+        class FakeResponse(object):
+            ok = True
+            content = json.dumps({"page": 1, "pages": 3}).encode()
+
+            def __init__(self, page):
+                self.page = page
+
+            def json(self):
+                return {"page": self.page, "pages": 3}
+
+        def fake_get(endpoint="", payload=None):
+            if payload["page"] == 2:
+                raise error
+            return FakeResponse(payload["page"])
+
+        self.ss.get = fake_get
+
+        responses = self.ss.fetch_all_orders()
+
+        self.assertEqual(responses[0].page, 1)
+        self.assertIs(responses[1], error)
+        self.assertEqual(responses[2].page, 3)
+
+    @raises(AttributeError)
+    def test_fetch_all_orders_must_use_correct_parameter(self):
+        self.ss.fetch_all_orders(parameters={"bad": "not good"})
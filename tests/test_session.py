@@ -0,0 +1,154 @@
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+import requests
+from shipstation.api import *
+
+
+class ShipStationSessionTests(unittest.TestCase):
+    def setUp(self):
+        self.ss = ShipStation("123", "456")
+
+    def tearDown(self):
+        self.ss.close()
+        self.ss = None
+
+    def test_get_and_post_send_through_session(self):
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append((method, url))
+
+        self.assertIsInstance(self.ss.session, requests.Session)
+        self.ss.session.request = fake_request
+        self.ss.get(endpoint="/orders/list")
+        self.ss.post(endpoint="/orders/createorder", data=b"{}")
+
+        self.assertEqual(calls, [
+            ("GET", self.ss.url + "/orders/list"),
+            ("POST", self.ss.url + "/orders/createorder"),
+        ])
+
+    def expected_authorization(self):
+        request = requests.Request("GET", self.ss.url).prepare()
+        requests.auth.HTTPBasicAuth("123", "456")(request)
+        return request.headers["Authorization"]
+
+    def prepare_list_request(self):
+        return self.ss.session.prepare_request(
+            requests.Request("GET", self.ss.url + "/orders/list")
+        )
+
+    def test_session_carries_credentials(self):
+        self.assertEqual(
+            self.prepare_list_request().headers["Authorization"],
+            self.expected_authorization(),
+        )
+
+    def test_credentials_are_not_overridden_by_netrc(self):
+        home = tempfile.mkdtemp()
+        netrc_path = os.path.join(home, ".netrc")
+        with open(netrc_path, "w") as f:
+            f.write("machine ssapi.shipstation.com login evil password pw\n")
+        os.chmod(netrc_path, 0o600)
+
+        environ = dict(os.environ)
+        os.environ["HOME"] = home
+        os.environ.pop("NETRC", None)
+        try:
+            request = self.prepare_list_request()
+        finally:
+            os.environ.clear()
+            os.environ.update(environ)
+            shutil.rmtree(home)
+
+        self.assertEqual(
+            request.headers["Authorization"], self.expected_authorization()
+        )
+
+    def test_context_manager_returns_client(self):
+        with ShipStation("123", "456") as ss:
+            self.assertIsInstance(ss, ShipStation)
+
+    def test_submit_orders_threaded_preserves_order(self):
+        submitted = []
+
+        def fake_post(endpoint="", data=None):
+            submitted.append(data)
+            return data
+
+        self.ss.post = fake_post
+        for number in range(5):
+            self.ss.add_order(ShipStationOrder(order_number=str(number)))
+
+        responses = self.ss.submit_orders_threaded(max_workers=3)
+
+        self.assertEqual(len(submitted), 5)
+        self.assertEqual(
+            [json.loads(r.decode("utf-8"))["orderNumber"] for r in responses],
+            ["0", "1", "2", "3", "4"],
+        )
+
+    def test_session_retries_throttled_requests(self):
+        adapter = self.ss.session.get_adapter(self.ss.url)
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+
+    def test_session_sends_json_content_type(self):
+        self.assertEqual(
+            self.ss.session.headers["content-type"], "application/json"
+        )
+
+    def test_requests_use_configured_timeout(self):
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(kwargs)
+
+        with ShipStation("123", "456", timeout=5) as ss:
+            ss.session.request = fake_request
+            ss.get(endpoint="/orders/list")
+
+        self.assertEqual(calls[0]["timeout"], 5)
+
+    def test_submit_orders_threaded_returns_failures_in_place(self):
+        timeout = requests.Timeout("timed out")
+
+        def fake_post(endpoint="", data=None):
+            if json.loads(data.decode("utf-8"))["orderNumber"] == "1":
+                raise timeout
+            return data
+
+        self.ss.post = fake_post
+        for number in range(3):
+            self.ss.add_order(ShipStationOrder(order_number=str(number)))
+
+        responses = self.ss.submit_orders_threaded(max_workers=3)
+
+        self.assertEqual(len(responses), 3)
+        self.assertIs(responses[1], timeout)
+        self.assertEqual(
+            json.loads(responses[2].decode("utf-8"))["orderNumber"], "2"
+        )
+
+    def test_submit_orders_threaded_without_orders(self):
+        self.assertEqual(self.ss.submit_orders_threaded(), [])
+
+    def test_debug_logging_tolerates_non_json_body(self):
+        response = requests.Response()
+        response.status_code = 401
+        response._content = b"<html>Unauthorized</html>"
+
+        logger = logging.getLogger("shipstation.api")
+        level = logger.level
+        logger.setLevel(logging.DEBUG)
+        try:
+            with ShipStation("123", "456", debug=True) as ss:
+                ss.session.request = lambda method, url, **kwargs: response
+                actual = ss.get(endpoint="/orders/list")
+        finally:
+            logger.setLevel(level)
+
+        self.assertIs(actual, response)